@@ -91,14 +91,16 @@ def demo_range_crawling(scraper):
         start_id = int(input("请输入起始文章ID (默认90001): ") or "90001")
         end_id = int(input("请输入结束文章ID (默认90100): ") or "90100")
         output_file = input("请输入输出文件名 (默认abstract.jsonl): ") or "abstract.jsonl"
-        delay = float(input("请输入请求间隔秒数 (默认0.2): ") or "0.2")
+        delay = float(input("请输入请求间隔秒数，所有线程共享，0表示不限速 (默认0.2): ") or "0.2")
+        max_workers = int(input("请输入并发线程数 (默认8): ") or "8")
     except ValueError:
         print("输入错误，使用默认参数")
-        start_id, end_id, output_file, delay = 90001, 90100, "abstract.jsonl", 0.2
+        start_id, end_id, output_file, delay, max_workers = 90001, 90100, "abstract.jsonl", 0.2, 8
     
     print(f"\n开始爬取文章 ID 范围: {start_id} - {end_id-1}")
     print(f"输出文件: {output_file}")
-    print(f"请求间隔: {delay} 秒")
+    print(f"请求间隔: {delay} 秒（约 {1 / delay:.1f} 次请求/秒）" if delay else "请求间隔: 不限速")
+    print(f"并发线程数: {max_workers}")
     print("按 Ctrl+C 可以随时停止\n")
     
     try:
@@ -106,7 +108,9 @@ def demo_range_crawling(scraper):
             start_id=start_id,
             end_id=end_id,
             output_file=output_file,
-            delay=delay
+            delay=delay,
+            max_workers=max_workers,
+            verbose=True
         )
         print(f"\n✓ 爬取完成！结果已保存到 {output_file}")
     except KeyboardInterrupt:
@@ -158,7 +162,7 @@ def interactive_mode(scraper):
                 output_file = input("输出文件名 (默认range_output.jsonl): ") or "range_output.jsonl"
                 delay = float(input("请求间隔 (默认0.2): ") or "0.2")
                 
-                scraper.process_article_range(start_id, end_id, output_file, delay)
+                scraper.process_article_range(start_id, end_id, output_file, delay, verbose=True)
                 print(f"完成！结果保存在 {output_file}")
             except (ValueError, KeyboardInterrupt) as e:
                 print(f"操作取消或输入错误: {e}")
@@ -1,36 +1,486 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
+from openai import OpenAI
 import time
 import json
+import orjson
+import html as html_lib
+import io
 import os
-from typing import Dict, List, Optional
+import re
+import random
+import threading
+from typing import Dict, List, Optional, Set, Tuple
 import logging
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from itertools import islice
 
 # 配置日志
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 
+def _has_class(name: str) -> str:
+    """生成按class单词匹配的XPath条件（等价于CSS的 .name）"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# 文章各字段的选择器：(字段, 标签, 元素id, 必须包含的class)，同一字段中靠前的优先
+_ARTICLE_SELECTORS = (
+    ('title', 'div', 'article-title', {'title'}),
+    ('title', 'div', None, {'title'}),  # 备用选择器
+    ('content', 'div', None, {'content', 'wangEditor-txt'}),
+    ('content', 'div', None, {'content'}),  # 备用选择器
+    ('author', 'a', None, {'ss__user__nickname__wrapper', 'nickname'}),
+    ('author', 'div', None, {'ss__user__nickname'}),  # 备用选择器
+    ('time', 'div', None, {'timer'}),
+)
+
+# 从链接中提取文章ID
+_POST_ID_RE = re.compile(r'/post/(\d+)')
+
+# 针对少数派固定页面模板的元数据正则，直接匹配原始字节
+_TITLE_RE = re.compile(rb'<div[^>]*\bid="article-title"[^>]*>([^<]+)</div>')
+_AUTHOR_RE = re.compile(rb'class="ss__user__nickname__wrapper nickname"[^>]*>\s*<span[^>]*>([^<]+)</span>')
+# class 属性可能包含多个类名，只要求其中之一为 timer，与lxml路径的类名匹配规则一致
+_TIMER_RE = re.compile(rb'<div[^>]*\bclass="(?:[^"]*\s)?timer(?:\s[^"]*)?"[^>]*>([^<]+)</div>')
+
+# 正文中需要提取文本的块级标签，以及提取前需要移除的标签
+_BLOCK_TAGS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'ul', 'ol')
+_DROP_TAGS = ('script', 'style', 'figcaption')
+
+# 预编译的XPath，所有请求复用；一次遍历文档即可取出所有选择器的候选元素
+_CANDIDATES_XPATH = lxml.etree.XPath('//*[{}]'.format(' or '.join(
+    f'(self::{tag} and {" and ".join(_has_class(name) for name in sorted(classes))})'
+    for _, tag, _, classes in _ARTICLE_SELECTORS
+)))
+
+
+def _find_article_elements(root) -> Dict[str, lxml.html.HtmlElement]:
+    """
+    单次遍历文档，按选择器优先级找出标题、正文、作者和发布时间元素
+
+    Args:
+        root: lxml文档根节点
+
+    Returns:
+        字段名到元素的映射，未找到的字段不包含在内
+    """
+    best = {}
+    for element in _CANDIDATES_XPATH(root):
+        classes = set(element.get('class', '').split())
+        for priority, (field, tag, element_id, required) in enumerate(_ARTICLE_SELECTORS):
+            if (element.tag == tag and required <= classes
+                    and (element_id is None or element.get('id') == element_id)
+                    and (field not in best or priority < best[field][0])):
+                best[field] = (priority, element)
+
+    return {field: element for field, (_, element) in best.items()}
+
+
+# 最近一次格式化的时间戳缓存：(整秒, ISO格式字符串)
+_now_cache = (0, '')
+
+
+def _now_isoformat() -> str:
+    """
+    返回精确到秒的当前时间ISO格式字符串，同一秒内复用已格式化的结果
+
+    Returns:
+        形如 2024-01-01T12:00:00 的时间字符串
+    """
+    global _now_cache
+    second = int(time.time())
+    if second != _now_cache[0]:
+        _now_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _now_cache[1]
+
+
+def _extract_meta(elements: Dict[str, lxml.html.HtmlElement]) -> Dict[str, str]:
+    """
+    从已定位的元素中提取标题、作者和发布时间
+
+    Args:
+        elements: _find_article_elements 的返回结果
+
+    Returns:
+        包含 title、author、publish_time 的字典
+    """
+    # 提取文章标题
+    title_element = elements.get('title')
+    title = title_element.text_content().strip() if title_element is not None else "未找到标题"
+
+    # 提取作者信息
+    author_element = elements.get('author')
+    if author_element is not None:
+        span = author_element.find('.//span')
+        author = (span if span is not None else author_element).text_content().strip()
+    else:
+        author = "未知作者"
+
+    # 提取发布时间（可选）
+    time_element = elements.get('time')
+    publish_time = time_element.text_content().strip() if time_element is not None else ""
+
+    return {'title': title, 'author': author, 'publish_time': publish_time}
+
+
+def _decode_match(match: re.Match) -> str:
+    """将正则匹配到的原始字节解码为去除首尾空白、还原HTML实体的文本"""
+    return html_lib.unescape(match.group(1).decode('utf-8', errors='replace')).strip()
+
+
+def _parse_article(html: bytes, article_id: str, url: str) -> Dict[str, str]:
+    """
+    解析文章页面HTML，提取标题、内容、作者和发布时间
+
+    纯函数且参数可被pickle，因此既可以在当前进程调用，也可以提交到进程池中执行。
+
+    Args:
+        html: 文章页面的原始字节
+        article_id: 文章ID
+        url: 文章链接
+
+    Returns:
+        包含文章标题和内容的字典
+    """
+    # 直接使用lxml构建文档树，避免BeautifulSoup在热路径上的额外开销
+    root = lxml.html.document_fromstring(html, parser=lxml.html.HTMLParser(encoding='utf-8'))
+
+    elements = _find_article_elements(root)
+
+    # 提取文章内容
+    content_element = elements.get('content')
+    if content_element is not None:
+        # 移除可能的脚本、样式和图片说明标签
+        for tag in list(content_element.iter(*_DROP_TAGS)):
+            tag.drop_tree()
+
+        # 获取所有段落和标题
+        text_parts = []
+        # iter() 在C层按文档顺序单次遍历子树，itertext() 同样在C层收集文本
+        for element in content_element.iter(*_BLOCK_TAGS):
+            text = ''.join(t.strip() for t in element.itertext())
+            if text:
+                text_parts.append(text)
+
+        content = '\n\n'.join(text_parts)
+    else:
+        content = "未找到文章内容"
+
+    meta = _extract_meta(elements)
+    logging.debug(f"成功爬取文章: {meta['title']}")
+
+    return {
+        'id': article_id,
+        'url': url,
+        'title': meta['title'],
+        'author': meta['author'],
+        'content': content,
+        'publish_time': meta['publish_time'],
+        'fetch_time': _now_isoformat()
+    }
+
+
+def _parse_article_meta(html: bytes, article_id: str, url: str) -> Dict[str, str]:
+    """
+    只提取文章的标题、作者和发布时间，不处理正文
+
+    少数派文章页使用固定模板，优先直接用预编译的正则匹配原始字节，跳过构建文档树；
+    标题、作者或发布时间任一匹配失败时（如页面模板变化）退回到lxml解析。
+
+    Args:
+        html: 文章页面的原始字节
+        article_id: 文章ID
+        url: 文章链接
+
+    Returns:
+        包含文章标题、作者和发布时间的字典
+    """
+    title_match = _TITLE_RE.search(html)
+    author_match = _AUTHOR_RE.search(html)
+    time_match = _TIMER_RE.search(html)
+
+    if title_match and author_match and time_match:
+        meta = {
+            'title': _decode_match(title_match),
+            'author': _decode_match(author_match),
+            'publish_time': _decode_match(time_match)
+        }
+    else:
+        root = lxml.html.document_fromstring(html, parser=lxml.html.HTMLParser(encoding='utf-8'))
+        meta = _extract_meta(_find_article_elements(root))
+
+    return {
+        'id': article_id,
+        'url': url,
+        'title': meta['title'],
+        'author': meta['author'],
+        'publish_time': meta['publish_time'],
+        'fetch_time': _now_isoformat()
+    }
+
+
+class TokenBucket:
+    """线程安全的令牌桶限速器，多个工作线程共享同一请求速率"""
+
+    def __init__(self, rate: float, burst: float):
+        """
+        初始化限速器
+
+        Args:
+            rate: 每秒补充的令牌数（即平均请求速率），0表示不限速
+            burst: 令牌桶容量（允许的突发请求数）
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        # 暂停截止时间（monotonic），与速率无关，调整速率不会改变暂停时长
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """按经过的时间补充令牌，暂停期间不补充（调用方需持有锁）"""
+        now = time.monotonic()
+        elapsed = now - max(self.updated, self._paused_until)
+        if elapsed > 0:
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """获取一个令牌，令牌不足时阻塞等待"""
+        while True:
+            with self._lock:
+                self._refill()
+                paused = self._paused_until - time.monotonic()
+                if paused > 0:
+                    wait_time = paused
+                elif self.rate == 0:
+                    # 不限速，只受暂停约束
+                    return
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
+
+    def pause(self, seconds: float):
+        """
+        清空令牌并让所有线程暂停指定时长，用于服务端要求降速时
+
+        Args:
+            seconds: 暂停时长（秒）
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+    def set_rate(self, rate: float):
+        """
+        调整令牌补充速率
+
+        Args:
+            rate: 新的每秒令牌数，0表示不限速
+        """
+        with self._lock:
+            self._refill()
+            self.rate = rate
+
+
 class SSPaiScraper:
     """少数派文章爬取和摘要生成器"""
 
-    def __init__(self, openai_api_key: Optional[str] = None):
+    # 需要退避重试的HTTP状态码、最大重试次数及退避参数（秒）
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 0.3
+    BACKOFF_CAP = 30.0
+    # 服务端 Retry-After 的最长等待时间（秒），只用于防止异常的超大值
+    RETRY_AFTER_CAP = 600.0
+    # 表示文章不存在的HTTP状态码；连续多少篇不存在后将请求速率提高为原来的多少倍
+    MISSING_STATUS_CODES = (404, 410)
+    MISSING_STREAK = 10
+    MISSING_RATE_FACTOR = 4.0
+    # 用于发现已存在文章ID的站点地图
+    SITEMAP_URL = "https://sspai.com/sitemap.xml"
+    # 范围爬取时每写入多少条记录刷新一次输出缓冲区
+    FLUSH_EVERY = 100
+    # 解析进程池损坏后最多重建几次，超过后停止爬取
+    PARSE_POOL_REBUILDS = 1
+
+    # 摘要生成使用的模型及固定的系统消息，所有请求共用
+    SUMMARY_MODEL = "gpt-4o-mini"  # 使用更经济的模型
+    SUMMARY_SYSTEM_MESSAGE = {"role": "system", "content": "你是一个专业的内容摘要生成助手，擅长提取文章核心内容。"}
+    # 提交给模型的正文最大字符数
+    SUMMARY_INPUT_LIMIT = 3000
+
+    def __init__(self, openai_api_key: Optional[str] = None, requests_per_second: float = 5.0):
         """
         初始化爬虫
 
         Args:
             openai_api_key: OpenAI API密钥（可选，默认从环境变量读取）
+            requests_per_second: 对少数派的最大平均请求速率，服务端返回限速信息时会自动下调；
+                                 0表示不主动限速，只按服务端的限速响应降速
         """
+        if requests_per_second < 0:
+            raise ValueError(f"requests_per_second 不能为负数: {requests_per_second}")
+
         # 优先使用传入的API密钥，否则从环境变量读取
         self.openai_api_key = openai_api_key or os.getenv('OPENAI_API_KEY')
         if not self.openai_api_key:
             raise ValueError("请设置OPENAI_API_KEY环境变量或传入API密钥")
 
+        # 复用同一个OpenAI客户端及其连接池
+        self.client = OpenAI(api_key=self.openai_api_key)
+
         self.base_url = "https://sspai.com/post/{}"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
+        # 复用连接池（keep-alive），避免每次请求都重新建立TCP+TLS连接
+        # 适配器只重试连接错误，429/5xx 由 _fetch_with_limit 根据响应头退避重试
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(connect=self.MAX_RETRIES, read=self.MAX_RETRIES, status=0,
+                      respect_retry_after_header=False, backoff_factor=self.BACKOFF_FACTOR)
+        self.session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry))
+
+        # 所有工作线程共享的限速器
+        self.requests_per_second = requests_per_second
+        self.rate_limiter = TokenBucket(rate=requests_per_second, burst=max(1.0, requests_per_second))
+
+    def _retry_wait(self, response: requests.Response, attempt: int) -> float:
+        """
+        计算重试前的等待时间：优先按服务端的 Retry-After 等待，否则指数退避并加入随机抖动
+
+        Args:
+            response: 需要重试的响应
+            attempt: 已重试次数
+
+        Returns:
+            等待时间（秒）
+        """
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return min(self.RETRY_AFTER_CAP, max(0.0, float(retry_after)))
+            except ValueError:
+                # Retry-After 也可能是HTTP日期格式，此时退回指数退避
+                pass
+
+        backoff = min(self.BACKOFF_CAP, self.BACKOFF_FACTOR * 2 ** attempt)
+        return backoff * random.uniform(0.5, 1.0)
+
+    def _set_request_rate(self, requests_per_second: float):
+        """
+        设置请求速率上限，并同步调整共享限速器
+
+        Args:
+            requests_per_second: 新的最大平均请求速率，0表示不限速
+        """
+        self.requests_per_second = requests_per_second
+        self.rate_limiter.set_rate(requests_per_second)
+
+    def _update_rate_limit(self, response: requests.Response):
+        """
+        根据 X-RateLimit-* 响应头调整请求速率
+
+        Args:
+            response: 成功的响应
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+
+        try:
+            remaining = int(remaining)
+            reset_seconds = float(reset)
+        except ValueError:
+            return
+
+        # Reset 可能是距离重置的秒数，也可能是Unix时间戳
+        if reset_seconds > time.time() / 2:
+            reset_seconds -= time.time()
+        reset_seconds = max(reset_seconds, 1.0)
+
+        if remaining <= 0:
+            self.rate_limiter.pause(reset_seconds)
+        else:
+            allowed_rate = remaining / reset_seconds
+            # 未主动限速（速率为0）时以服务端允许的速率为准
+            if self.requests_per_second:
+                allowed_rate = min(self.requests_per_second, allowed_rate)
+            self.rate_limiter.set_rate(allowed_rate)
+
+    def _fetch_with_limit(self, url: str) -> requests.Response:
+        """
+        经过限速器发送GET请求，遇到429/5xx时退避重试
+
+        不使用流式请求：响应体（包括404和错误页）总会被完整读取，
+        连接才能放回连接池复用，而不必为下一次请求重新握手。
+
+        Args:
+            url: 请求地址
+
+        Returns:
+            最后一次请求的响应
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            self.rate_limiter.acquire()
+            response = self.session.get(url, timeout=10)
+
+            if response.status_code not in self.RETRY_STATUS_CODES:
+                self._update_rate_limit(response)
+                return response
+            if attempt == self.MAX_RETRIES:
+                return response
+
+            wait_time = self._retry_wait(response, attempt)
+            logging.warning(f"请求 {url} 返回 {response.status_code}，{wait_time:.1f} 秒后重试")
+            if response.status_code in (429, 503):
+                # 服务端明确要求降速，让所有线程一起暂停
+                self.rate_limiter.pause(wait_time)
+            else:
+                time.sleep(wait_time)
+
+    def _download_article(self, article_id: str) -> Tuple[Optional[bytes], bool]:
+        """
+        下载指定ID的文章页面
+
+        Args:
+            article_id: 文章ID
+
+        Returns:
+            (页面的原始字节, 文章是否不存在)，下载失败或文章不存在时字节为None
+        """
+        url = self.base_url.format(article_id)
+
+        try:
+            with self._fetch_with_limit(url) as response:
+                if response.status_code in self.MISSING_STATUS_CODES:
+                    # 文章不存在：不解析、不重试
+                    logging.debug(f"文章 {article_id} 不存在（HTTP {response.status_code}）")
+                    return None, True
+
+                response.raise_for_status()
+                # 直接返回原始字节交给lxml按UTF-8解析，不经过 response.text 的解码和编码检测
+                return response.content, False
+
+        except requests.RequestException as e:
+            logging.error(f"爬取文章 {article_id} 失败: {e}")
+            return None, False
+
     def fetch_article(self, article_id: str) -> Optional[Dict[str, str]]:
         """
         爬取指定ID的文章
@@ -41,76 +491,32 @@ class SSPaiScraper:
         Returns:
             包含文章标题和内容的字典，失败返回None
         """
-        url = self.base_url.format(article_id)
+        html, _ = self._download_article(article_id)
+        if html is None:
+            return None
 
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # 提取文章标题 - 根据实际HTML结构优化
-            title_element = soup.find('div', {'id': 'article-title', 'class': 'title'})
-            if not title_element:
-                # 备用选择器
-                title_element = soup.find('div', class_='title')
-
-            title = title_element.text.strip() if title_element else "未找到标题"
-
-            # 提取文章内容 - 使用更精确的选择器
-            content_element = soup.find('div', class_='content wangEditor-txt')
-            if not content_element:
-                # 备用选择器
-                content_element = soup.find('div', class_='content')
-
-            if content_element:
-                # 移除可能的脚本、样式和图片说明标签
-                for tag in content_element(['script', 'style', 'figcaption']):
-                    tag.decompose()
-
-                # 获取所有段落和标题
-                text_parts = []
-                for element in content_element.find_all(
-                        ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'ul', 'ol']):
-                    text = element.get_text(strip=True)
-                    if text:
-                        text_parts.append(text)
-
-                content = '\n\n'.join(text_parts)
-            else:
-                content = "未找到文章内容"
+            return _parse_article(html, article_id, self.base_url.format(article_id))
+        except Exception as e:
+            logging.error(f"处理文章 {article_id} 时出错: {e}")
+            return None
 
-            # 提取作者信息 - 使用更精确的选择器
-            author_element = soup.find('a', class_='ss__user__nickname__wrapper nickname')
-            if not author_element:
-                # 备用选择器
-                author_element = soup.find('div', class_='ss__user__nickname')
+    def fetch_article_meta(self, article_id: str) -> Optional[Dict[str, str]]:
+        """
+        只爬取指定ID文章的标题、作者和发布时间（不含正文），适合只需要元数据的场景
 
-            if author_element:
-                author = author_element.find('span').text.strip() if author_element.find(
-                    'span') else author_element.text.strip()
-            else:
-                author = "未知作者"
-
-            # 提取发布时间（可选）
-            time_element = soup.find('div', class_='timer')
-            publish_time = time_element.text.strip() if time_element else ""
-
-            logging.info(f"成功爬取文章: {title}")
-
-            return {
-                'id': article_id,
-                'url': url,
-                'title': title,
-                'author': author,
-                'content': content,
-                'publish_time': publish_time,
-                'fetch_time': datetime.now().isoformat()
-            }
+        Args:
+            article_id: 文章ID
 
-        except requests.RequestException as e:
-            logging.error(f"爬取文章 {article_id} 失败: {e}")
+        Returns:
+            包含文章标题、作者和发布时间的字典，失败返回None
+        """
+        html, _ = self._download_article(article_id)
+        if html is None:
             return None
+
+        try:
+            return _parse_article_meta(html, article_id, self.base_url.format(article_id))
         except Exception as e:
             logging.error(f"处理文章 {article_id} 时出错: {e}")
             return None
@@ -127,9 +533,12 @@ class SSPaiScraper:
             生成的摘要
         """
         try:
-            # 初始化OpenAI客户端（新版本API）
-            from openai import OpenAI
-            client = OpenAI(api_key=self.openai_api_key)
+            # 限制输入长度以节省token，尽量在段落边界处截断
+            content = article['content']
+            limit = self.SUMMARY_INPUT_LIMIT
+            if len(content) > limit:
+                cut = content.rfind('\n\n', 0, limit)
+                content = content[:cut if cut > limit // 2 else limit]
 
             # 准备提示词
             prompt = f"""请为以下文章生成一个简洁的中文摘要，摘要应该：
@@ -140,15 +549,15 @@ class SSPaiScraper:
 
 文章标题：{article['title']}
 文章内容：
-{article['content'][:3000]}  # 限制输入长度以节省token
+{content}
 
 请生成摘要："""
 
             # 调用OpenAI API（新版本方式）
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",  # 使用更经济的模型
+            response = self.client.chat.completions.create(
+                model=self.SUMMARY_MODEL,
                 messages=[
-                    {"role": "system", "content": "你是一个专业的内容摘要生成助手，擅长提取文章核心内容。"},
+                    self.SUMMARY_SYSTEM_MESSAGE,
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=500,
@@ -156,7 +565,7 @@ class SSPaiScraper:
             )
 
             summary = response.choices[0].message.content.strip()
-            logging.info(f"成功生成文章 {article['id']} 的摘要")
+            logging.debug(f"成功生成文章 {article['id']} 的摘要")
 
             return summary
 
@@ -179,18 +588,24 @@ class SSPaiScraper:
         content = article['content']
         # 取前几段内容作为摘要
         paragraphs = content.split('\n\n')
-        summary = ""
+        # 收集片段后一次性拼接，避免循环中反复创建字符串
+        parts = []
+        total = 0
 
         for para in paragraphs:
-            if len(summary) + len(para) <= max_length:
-                summary += para + " "
+            para_length = len(para)
+            if total + para_length <= max_length:
+                parts.append(para)
+                parts.append(" ")
+                total += para_length + 1
             else:
-                remaining = max_length - len(summary)
+                remaining = max_length - total
                 if remaining > 20:  # 如果剩余空间足够
-                    summary += para[:remaining - 3] + "..."
+                    parts.append(para[:remaining - 3])
+                    parts.append("...")
                 break
 
-        return summary.strip() if summary else content[:max_length - 3] + "..."
+        return ''.join(parts).strip() if parts else content[:max_length - 3] + "..."
 
     def process_article(self, article_id: str) -> Optional[Dict[str, str]]:
         """
@@ -207,10 +622,19 @@ class SSPaiScraper:
         if not article:
             return None
 
-        # 生成摘要
-        summary = self.generate_summary(article)
-        article['summary'] = summary
+        return self._add_summary(article)
+
+    def _add_summary(self, article: Dict[str, str]) -> Dict[str, str]:
+        """
+        为已爬取的文章生成摘要并写入 summary 字段
 
+        Args:
+            article: 文章信息字典
+
+        Returns:
+            包含摘要的文章信息字典
+        """
+        article['summary'] = self.generate_summary(article)
         return article
 
     def process_multiple_articles(self, article_ids: List[str], delay: float = 2.0) -> List[Dict[str, str]]:
@@ -239,47 +663,277 @@ class SSPaiScraper:
 
         return results
 
-    def process_article_range(self, start_id: int, end_id: int, output_file: str = "abstract.jsonl", delay: float = 0.2):
+    def discover_ids(self) -> Set[int]:
+        """
+        从站点地图中发现已存在的文章ID，支持站点地图索引嵌套子站点地图
+
+        Returns:
+            文章ID集合，获取失败时返回空集合
+        """
+        article_ids = set()
+        pending = [self.SITEMAP_URL]
+        visited = set()
+
+        while pending:
+            sitemap_url = pending.pop()
+            if sitemap_url in visited:
+                continue
+            visited.add(sitemap_url)
+
+            try:
+                with self._fetch_with_limit(sitemap_url) as response:
+                    response.raise_for_status()
+                    content = response.content
+
+                for _, element in lxml.etree.iterparse(io.BytesIO(content), tag='{*}loc'):
+                    loc = (element.text or '').strip()
+                    # 先按父元素区分子站点地图，其链接本身也可能包含 /post/<数字>
+                    if lxml.etree.QName(element.getparent()).localname == 'sitemap':
+                        # 站点地图索引中的子站点地图
+                        pending.append(loc)
+                    else:
+                        match = _POST_ID_RE.search(loc)
+                        if match:
+                            article_ids.add(int(match.group(1)))
+                    element.clear()
+
+            except (requests.RequestException, lxml.etree.XMLSyntaxError) as e:
+                logging.warning(f"读取站点地图 {sitemap_url} 失败: {e}")
+
+        logging.info(f"从站点地图中发现 {len(article_ids)} 篇文章")
+        return article_ids
+
+    def _new_parse_executor(self, parse_workers: int) -> ProcessPoolExecutor:
+        """
+        创建HTML解析进程池
+
+        spawn方式启动的子进程会重新导入调用方的主模块，调用脚本必须把入口代码放在
+        if __name__ == "__main__": 之下，否则每个子进程都会重新执行爬取。
+
+        Args:
+            parse_workers: 解析进程数
+
+        Returns:
+            解析进程池
+        """
+        # 使用spawn启动解析进程，避免在已有工作线程的进程中fork导致锁状态被复制
+        return ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context('spawn'))
+
+    def _load_done_ids(self, output_file: str) -> Set[str]:
+        """
+        读取已有JSONL输出文件中已保存的文章ID，用于断点续传
+
+        Args:
+            output_file: 输出文件路径
+
+        Returns:
+            已保存的文章ID集合
+        """
+        done_ids = set()
+        if not os.path.exists(output_file):
+            return done_ids
+
+        with open(output_file, "rb") as f:
+            for line in f:
+                try:
+                    done_ids.add(str(orjson.loads(line)['id']))
+                except (ValueError, KeyError, TypeError):
+                    # 中断时可能留下不完整的最后一行，直接忽略
+                    continue
+
+        return done_ids
+
+    def _has_partial_last_line(self, output_file: str) -> bool:
+        """
+        检查输出文件是否以不完整的行结尾（未以换行符结束）
+
+        Args:
+            output_file: 输出文件路径
+
+        Returns:
+            文件非空且最后一个字节不是换行符时返回True
+        """
+        if not os.path.exists(output_file) or os.path.getsize(output_file) == 0:
+            return False
+
+        with open(output_file, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def process_article_range(self, start_id: int, end_id: int, output_file: str = "abstract.jsonl",
+                              delay: Optional[float] = None, max_workers: int = 8, summary_workers: int = 16,
+                              resume: bool = True, parse_workers: Optional[int] = None,
+                              use_sitemap: bool = False, verbose: bool = False):
         """
         批量处理指定范围的文章ID，并实时保存到JSONL文件
 
+        下载、解析和摘要生成组成三级流水线：下载和摘要请求分别在线程池中并发执行，
+        HTML解析默认在当前线程中进行；指定 parse_workers 时改为在进程池中执行以绕开GIL，
+        使解析的CPU开销与网络等待重叠。结果统一由当前线程写入文件，因此写入顺序为完成顺序而非ID顺序。
+
         Args:
             start_id: 起始文章ID
             end_id: 结束文章ID（不包含）
             output_file: 输出文件路径
-            delay: 请求间隔（秒）
+            delay: 所有线程共享的平均请求间隔（秒），传入时本次爬取的请求速率为 1/delay，
+                   0表示不限速，None表示使用初始化时的 requests_per_second
+            max_workers: 并发下载线程数
+            summary_workers: 并发摘要请求数（受OpenAI速率限制约束）
+            resume: 是否跳过输出文件中已保存的文章ID（断点续传）
+            parse_workers: 解析进程数，None表示在当前进程中解析；使用进程池时调用脚本的入口
+                           必须放在 if __name__ == "__main__": 之下
+            use_sitemap: 是否先从站点地图获取已存在的文章ID，只请求范围内确实存在的文章
+            verbose: 是否逐篇打印标题、作者和摘要（关闭时只定期输出进度日志）
         """
-        logging.info(f"开始批量处理文章 ID 范围: {start_id} - {end_id-1}")
+        if delay is not None and delay < 0:
+            raise ValueError(f"delay 不能为负数: {delay}")
+
+        logging.info(f"开始批量处理文章 ID 范围: {start_id} - {end_id-1}（并发数: {max_workers}）")
         
         success_count = 0
         total_count = end_id - start_id
-        
-        for article_id in range(start_id, end_id):
-            time.sleep(delay)
-            
-            result = self.process_article(str(article_id))
-            if result:
-                success_count += 1
-                print(f"\n[{success_count}/{total_count}] 标题: {result['title']}")
-                print(f"作者: {result['author']}")
-                print(f"摘要: {result['summary'][:100]}...")
-
-                # 构建记录字典
-                record = {
-                    "id": result['id'],
-                    "title": result['title'],
-                    "author": result['author'],
-                    "summary": result['summary'],
-                    "url": result['url'],
-                    "publish_time": result['publish_time'],
-                    "fetch_time": result['fetch_time']
+        article_ids = iter(range(start_id, end_id))
+
+        if resume:
+            done_ids = self._load_done_ids(output_file)
+            if done_ids:
+                logging.info(f"断点续传：{output_file} 中已有 {len(done_ids)} 篇文章，将跳过这些ID")
+                article_ids = (article_id for article_id in article_ids if str(article_id) not in done_ids)
+
+        if use_sitemap:
+            known_ids = self.discover_ids()
+            if known_ids:
+                in_range = sum(1 for article_id in known_ids if start_id <= article_id < end_id)
+                logging.info(f"站点地图中共有 {len(known_ids)} 篇文章，范围内 {in_range} 篇，将跳过其余ID")
+                article_ids = (article_id for article_id in article_ids if article_id in known_ids)
+            else:
+                logging.warning("未能从站点地图获取文章ID，将遍历整个范围")
+
+        # 限制同时排队的任务数量，避免一次性为整个ID范围创建任务
+        window = max_workers * 4
+        # 本次爬取中连续遇到的不存在文章数（按完成顺序，仅由当前线程更新）
+        missing_streak = 0
+
+        # 请求速率完全由共享的令牌桶控制，不再在每个任务前固定sleep
+        original_rate = self.requests_per_second
+        if delay is None:
+            base_rate = original_rate
+        else:
+            base_rate = 1.0 / delay if delay > 0 else 0.0
+        self._set_request_rate(base_rate)
+
+        # 整个范围只打开一次输出文件，以二进制追加模式缓冲写入 JSONL（orjson直接输出UTF-8字节）
+        with open(output_file, "ab", buffering=1024 * 1024) as out:
+            # 上次中断可能留下不完整的最后一行，先换行避免新记录与其拼接
+            if self._has_partial_last_line(output_file):
+                out.write(b"\n")
+
+            download_executor = ThreadPoolExecutor(max_workers=max_workers)
+            parse_executor = self._new_parse_executor(parse_workers) if parse_workers else None
+            parse_pool_rebuilds = 0
+            summary_executor = ThreadPoolExecutor(max_workers=summary_workers)
+            try:
+                # 每篇文章同一时刻只有一个进行中的任务（下载、解析或摘要），文章处理完毕后才补充新ID
+                pending = {
+                    download_executor.submit(self._download_article, str(article_id)): (article_id, 'download')
+                    for article_id in islice(article_ids, window)
                 }
 
-                # 以追加模式写入 JSONL 文件
-                with open(output_file, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
-            else:
-                print(f"跳过文章 ID: {article_id}")
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        article_id, stage = pending.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            logging.error(f"处理文章 {article_id} 时出错: {e}")
+                            result = None
+
+                        if result is not None and stage == 'download':
+                            result, missing = result
+                            if missing:
+                                missing_streak += 1
+                            elif result is not None:
+                                missing_streak = 0
+                            # 连续遇到不存在的文章说明处于稀疏的ID区间，服务器压力很小，提高请求速率
+                            rate = base_rate
+                            if missing_streak >= self.MISSING_STREAK:
+                                rate = base_rate * self.MISSING_RATE_FACTOR
+                            if rate != self.requests_per_second:
+                                self._set_request_rate(rate)
+
+                        if result is not None and stage == 'download':
+                            url = self.base_url.format(article_id)
+                            if parse_executor is None:
+                                # 未使用进程池：在当前线程中解析，结果直接进入摘要阶段
+                                try:
+                                    result = _parse_article(result, str(article_id), url)
+                                except Exception as e:
+                                    logging.error(f"处理文章 {article_id} 时出错: {e}")
+                                    result = None
+                                stage = 'parse'
+                            else:
+                                # 下载完成，交给解析进程池
+                                try:
+                                    parse_future = parse_executor.submit(_parse_article, result, str(article_id), url)
+                                except BrokenProcessPool:
+                                    # 反复损坏通常说明子进程无法启动（如调用脚本缺少 __main__ 保护），停止爬取
+                                    if parse_pool_rebuilds >= self.PARSE_POOL_REBUILDS:
+                                        logging.error("解析进程池反复损坏，停止爬取；请检查调用脚本的入口是否放在 "
+                                                      "if __name__ == '__main__': 之下，或不指定 parse_workers")
+                                        raise
+                                    # 有解析进程异常退出（如被OOM终止）后进程池不可再用，重建后继续
+                                    logging.error("解析进程池已损坏（解析进程异常退出），重新创建进程池")
+                                    parse_pool_rebuilds += 1
+                                    parse_executor.shutdown(wait=False, cancel_futures=True)
+                                    parse_executor = self._new_parse_executor(parse_workers)
+                                    parse_future = parse_executor.submit(_parse_article, result, str(article_id), url)
+                                pending[parse_future] = (article_id, 'parse')
+                                continue
+
+                        if result is not None and stage == 'parse':
+                            # 解析完成，交给摘要线程池
+                            pending[summary_executor.submit(self._add_summary, result)] = (article_id, 'summary')
+                            continue
+
+                        if result is not None:
+                            success_count += 1
+                            if verbose:
+                                print(f"\n[{success_count}/{total_count}] 标题: {result['title']}\n"
+                                      f"作者: {result['author']}\n"
+                                      f"摘要: {result['summary'][:100]}...")
+
+                            # 构建记录字典
+                            record = {
+                                "id": result['id'],
+                                "title": result['title'],
+                                "author": result['author'],
+                                "summary": result['summary'],
+                                "url": result['url'],
+                                "publish_time": result['publish_time'],
+                                "fetch_time": result['fetch_time']
+                            }
+
+                            out.write(orjson.dumps(record) + b"\n")
+                            # 定期刷新缓冲区，中断时最多丢失少量记录
+                            if success_count % self.FLUSH_EVERY == 0:
+                                out.flush()
+                                logging.info(f"进度：已成功处理 {success_count}/{total_count} 篇文章")
+                        elif verbose:
+                            print(f"跳过文章 ID: {article_id}")
+
+                        # 每处理完一篇文章补充一个新任务
+                        for next_id in islice(article_ids, 1):
+                            next_future = download_executor.submit(self._download_article, str(next_id))
+                            pending[next_future] = (next_id, 'download')
+            finally:
+                # 中断时取消尚未开始的任务，只等待正在执行的任务
+                download_executor.shutdown(wait=True, cancel_futures=True)
+                if parse_executor is not None:
+                    parse_executor.shutdown(wait=True, cancel_futures=True)
+                summary_executor.shutdown(wait=True, cancel_futures=True)
+                self._set_request_rate(original_rate)
         
         logging.info(f"批量处理完成！成功处理 {success_count}/{total_count} 篇文章")
 
@@ -331,10 +985,11 @@ class SSPaiScraper:
             分析结果字典
         """
         try:
-            with open(html_file_path, 'r', encoding='utf-8') as f:
+            with open(html_file_path, 'rb') as f:
                 html_content = f.read()
 
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # 直接把原始字节和已知编码交给解析器，跳过Python层解码和编码检测
+            soup = BeautifulSoup(html_content, 'lxml', from_encoding='utf-8')
 
             # 分析可能的标题选择器
             title_candidates = []